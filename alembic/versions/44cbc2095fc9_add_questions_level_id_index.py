@@ -0,0 +1,27 @@
+"""add questions level_id index
+
+Revision ID: 44cbc2095fc9
+Revises: 8b16097789ad
+Create Date: 2026-10-15 09:47:03.518772
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '44cbc2095fc9'
+down_revision: Union[str, None] = '8b16097789ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets questions_count in /admin/levels be counted from the index alone
+    op.create_index(op.f('ix_questions_level_id'), 'questions', ['level_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_questions_level_id'), table_name='questions')
@@ -0,0 +1,27 @@
+"""add answers question_id index
+
+Revision ID: 8b16097789ad
+Revises: fdbd9468ddfc
+Create Date: 2026-10-15 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b16097789ad'
+down_revision: Union[str, None] = 'fdbd9468ddfc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # selectinload(Question.answers) filters answers by question_id IN (...)
+    op.create_index(op.f('ix_answers_question_id'), 'answers', ['question_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_answers_question_id'), table_name='answers')
@@ -1,19 +1,86 @@
-# database.py - SQLite connection with async SQLAlchemy
+# database.py - SQLite (or Postgres via asyncpg) connection with async SQLAlchemy
 
 import os
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import sessionmaker
 
 from models import Base
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./database.sqlite")
+# Anchored to the project root so main.py, init_db.py and seeders/ all open the same file
+# regardless of the working directory they are started from
+DEFAULT_DATABASE_PATH = Path(__file__).resolve().parent / "database.sqlite"
+
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite+aiosqlite:///{DEFAULT_DATABASE_PATH}")
+# Hosted Postgres hands out plain postgres:// URLs - run them through asyncpg
+if DATABASE_URL.startswith(("postgres://", "postgresql://")):
+    DATABASE_URL = "postgresql+asyncpg://" + DATABASE_URL.split("://", 1)[1]
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+IS_SQLITE_MEMORY = IS_SQLITE and ":memory:" in DATABASE_URL
+# Set to "0" when the schema is managed by Alembic (`alembic upgrade head`); for
+# local single-process runs only, since create_all is not safe across workers
+AUTO_CREATE_SCHEMA = os.getenv("AUTO_CREATE_SCHEMA", "1") == "1"
+
+# Sizing for the queue pools used with a database file or server
+QUEUE_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 5,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+if IS_SQLITE_MEMORY:
+    # Every new connection to :memory: is a separate, empty database, so all
+    # sessions have to share one connection (aiosqlite's own default)
+    engine_options = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+elif IS_SQLITE:
+    # aiosqlite defaults to NullPool for file databases, which reopens the file
+    # (and reapplies PRAGMAs) on every request - keep a pool of warm connections instead
+    engine_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "connect_args": {"check_same_thread": False, "timeout": 5},
+        **QUEUE_POOL_OPTIONS,
+    }
+else:
+    # asyncpg caches prepared statements per connection, so repeated lookups skip parse/plan
+    engine_options = {
+        "connect_args": {"prepared_statement_cache_size": 500, "statement_cache_size": 500},
+        **QUEUE_POOL_OPTIONS,
+    }
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+engine = create_async_engine(DATABASE_URL, echo=False, **engine_options)
+
+# PRAGMAs applied to every new SQLite connection. foreign_keys=ON is required:
+# the admin endpoints rely on the FK constraints to reject unknown parents with 404
+SQLITE_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "busy_timeout=5000",
+    "foreign_keys=ON",
+)
+# Only meaningful for a database file, skipped for :memory:
+# WAL lets readers run during a write and syncs once per checkpoint instead of per commit
+SQLITE_FILE_PRAGMAS = (
+    "journal_mode=WAL",
+    "mmap_size=10737418240",
 )
 
+if IS_SQLITE:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        pragmas = SQLITE_PRAGMAS if IS_SQLITE_MEMORY else SQLITE_FILE_PRAGMAS + SQLITE_PRAGMAS
+        cursor = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -1,21 +1,35 @@
 # main.py — Backend API for Vue admin panel with SQLite database
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta, timezone
 
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from jose import JWTError, jwt
+import jwt
+from jwt.algorithms import HMACAlgorithm
+from argon2.exceptions import InvalidHashError, VerificationError
 import bcrypt
-from sqlalchemy import select, func
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, delete, exists, func, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 import os
+import time
 
-from database import get_db, init_db
+from database import AsyncSessionLocal, get_db, init_db, AUTO_CREATE_SCHEMA, IS_SQLITE
 from models import Admin, Level, Question, Answer, User
+from passwords import password_hasher
 from schemas import (
     LevelOut, QuestionOut, AnswerOut,
     LevelCreate, LevelUpdate,
@@ -26,6 +40,9 @@ from schemas import (
     Token,
 )
 
+# INSERT ... ON CONFLICT builder for whichever backend DATABASE_URL points to
+upsert_insert = sqlite_insert if IS_SQLITE else postgresql_insert
+
 
 # -------------------------------------------------
 # Lifespan - database initialization
@@ -33,23 +50,70 @@ from schemas import (
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
+    global _hash_pool
+    # Runs once per worker; skipped entirely when Alembic owns the schema (as in
+    # render.yaml). create_all checks and then issues a plain CREATE, so
+    # concurrent workers can race on a fresh database
+    if AUTO_CREATE_SCHEMA:
+        await init_db()
+    _hash_pool = ThreadPoolExecutor(max_workers=HASH_POOL_SIZE, thread_name_prefix="hash")
     yield
+    _hash_pool.shutdown()
+    _hash_pool = None
 
 
 # -------------------------------------------------
 # Application and CORS
 # -------------------------------------------------
 
-app = FastAPI(lifespan=lifespan)
+# Parsed once at import; render.yaml sets CORS_ORIGINS as a comma-separated list
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "https://fiszkiadminpanelfrontend.vercel.app").split(",")
+    if origin.strip()
+]
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["https://fiszkiadminpanelfrontend.vercel.app"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+
+# -------------------------------------------------
+# Read cache for the public level list
+# -------------------------------------------------
+
+# Levels only change through admin CRUD, so the public serialized list is
+# kept per process for a short time. A write only drops the cache of the
+# worker that handled it, so other workers may serve it for up to the TTL;
+# that's fine for learners, but the admin panel reads its own writes and is
+# never cached.
+LEVELS_CACHE_TTL = float(os.getenv("LEVELS_CACHE_TTL", "30"))
+_levels_cache: dict[str, tuple[float, bytes]] = {}
+
+_levels_adapter = TypeAdapter(list[LevelOut])
+
+
+def get_cached_levels(key: str) -> Response | None:
+    cached = _levels_cache.get(key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return Response(content=cached[1], media_type="application/json")
+
+
+def cache_levels(key: str, content: bytes) -> Response:
+    _levels_cache[key] = (time.monotonic() + LEVELS_CACHE_TTL, content)
+    return Response(content=content, media_type="application/json")
+
+
+def invalidate_levels_cache() -> None:
+    _levels_cache.clear()
 
 
 # -------------------------------------------------
@@ -59,49 +123,162 @@ app.add_middleware(
 SECRET_KEY = os.getenv("SECRET_KEY", "jnUubi5NNKDkRd2neldQRikDcOeQ5MagGnRvsxki7sQ")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+ACCESS_TOKEN_TTL_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 RESET_CODE = os.getenv("RESET_CODE", "1111")
 
+# One PyJWT instance and a pre-prepared HMAC key shared by every encode/decode
+_jwt = jwt.PyJWT()
+_JWT_KEY = HMACAlgorithm(HMACAlgorithm.SHA256).prepare_key(SECRET_KEY)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
+# Already validated admin tokens: blake2b(token) -> (id_admin, exp), oldest first.
+# A 16-byte digest key keeps entries small compared to the full token string
+AUTH_CACHE_SIZE = 4096
+_auth_cache: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
+# Passwords are hashed with Argon2id (passwords.password_hasher) by the app,
+# migrate_data.py and the seeders alike; bcrypt hashes from before the switch
+# are still accepted and replaced on the next successful login
 
-def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+# Hash of a random throwaway password with the same parameters. Logins for unknown
+# accounts verify against it so they take as long as a wrong password for a real one
+DUMMY_PASSWORD_HASH = "$argon2id$v=19$m=65536,t=2,p=4$t0E7imhypRjT0rH8QjQBGw$aMNOQm1+eBddGpRF4PYTw6yLSxxd+ztBz7Sc3LTZUvQ"
 
+# Hashing burns ~100ms of CPU per call, so it runs off the event loop. bcrypt and
+# argon2-cffi both release the GIL, so a few threads hash in parallel without
+# forking processes (falls back to the default thread pool outside the lifespan).
+_hash_pool: ThreadPoolExecutor | None = None
+# Per uvicorn worker. Each argon2 hash holds 64 MiB while it runs, so this also
+# caps hashing memory; os.cpu_count() would ignore container CPU/memory limits.
+HASH_POOL_SIZE = max(1, int(os.getenv("HASH_POOL_SIZE", "2")))
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(hours=12))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    if not hashed_password.startswith("$argon2"):
+        return await loop.run_in_executor(
+            _hash_pool, bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+        )
+    try:
+        return await loop.run_in_executor(
+            _hash_pool, password_hasher.verify, hashed_password, plain_password
+        )
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def get_password_hash(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_pool, password_hasher.hash, password
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return (
+        not hashed_password.startswith("$argon2")
+        or password_hasher.check_needs_rehash(hashed_password)
+    )
+
+
+def create_access_token(data: dict, expires_in: int = ACCESS_TOKEN_TTL_SECONDS) -> str:
+    # exp as plain epoch seconds, no datetime objects on the login path
+    to_encode = {**data, "exp": int(time.time()) + expires_in}
+    return _jwt.encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
 
 async def get_current_admin(token: str = Depends(oauth2_scheme)) -> dict:
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        if cached[1] > time.time():
+            _auth_cache.move_to_end(cache_key)
+            return {"id_admin": cached[0], "role": "admin"}
+        del _auth_cache[cache_key]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _jwt.decode(token, _JWT_KEY, algorithms=[ALGORITHM])
         admin_id: str | None = payload.get("sub")
         role: str | None = payload.get("role")
         if admin_id is None or role != "admin":
             raise credentials_exception
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
 
+    exp = payload.get("exp")
+    if exp is not None:
+        _auth_cache[cache_key] = (int(admin_id), float(exp))
+        if len(_auth_cache) > AUTH_CACHE_SIZE:
+            _auth_cache.popitem(last=False)
+
     return {"id_admin": int(admin_id), "role": role}
 
 
+# -------------------------------------------------
+# Keyset pagination and streaming for admin lists
+# -------------------------------------------------
+
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 500
+
+
+def paginate(stmt, id_column, after_id: int, limit: int | None):
+    """Return rows with id > after_id in id order; all of them if limit is None."""
+    stmt = stmt.where(id_column > after_id).order_by(id_column)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def stream_json_list(stmt, serialize, scalars: bool = False) -> StreamingResponse:
+    """Stream the rows of stmt as one JSON array, STREAM_BATCH_SIZE rows at a time.
+
+    Uses its own session: yield-dependencies are closed before a streaming
+    body is sent, so the request's get_db session can't be used here.
+    """
+    stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+
+    async def body():
+        async with AsyncSessionLocal() as session:
+            if scalars:
+                result = await session.stream_scalars(stmt)
+            else:
+                result = (await session.stream(stmt)).mappings()
+            yield b"["
+            separator = b""
+            async for partition in result.partitions():
+                yield separator + b",".join(serialize(row) for row in partition)
+                separator = b","
+            yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
 # -------------------------------------------------
 # Health check
 # -------------------------------------------------
 
+# Liveness probe is hit every few seconds, so its body is built once
+HEALTH_RESPONSE = b'{"status":"ok"}'
+
+
 @app.get("/health")
 async def health():
+    return Response(content=HEALTH_RESPONSE, media_type="application/json")
+
+
+@app.get("/ready")
+async def ready(db: AsyncSession = Depends(get_db)):
+    # Readiness probe: the database must answer a trivial query
+    try:
+        await db.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
     return {"status": "ok"}
 
 
@@ -111,25 +288,37 @@ async def health():
 
 @app.get("/levels", response_model=list[LevelOut])
 async def get_levels(db: AsyncSession = Depends(get_db)):
+    cached = get_cached_levels("levels")
+    if cached is not None:
+        return cached
+
     result = await db.execute(select(Level))
     levels = result.scalars().all()
-    return levels
+    levels_out = _levels_adapter.validate_python(levels, from_attributes=True)
+    return cache_levels("levels", _levels_adapter.dump_json(levels_out))
+
+
+# Built once; validates and serializes the whole list in a single pydantic-core call
+_questions_adapter = TypeAdapter(list[QuestionOut])
 
 
 @app.get("/levels/{level_id}/questions", response_model=list[QuestionOut])
 async def get_questions(level_id: int, db: AsyncSession = Depends(get_db)):
-    # Check if level exists
-    level = await db.get(Level, level_id)
-    if not level:
+    # Check if level exists (EXISTS probe, the row itself is not needed)
+    if not await db.scalar(select(exists().where(Level.level_id == level_id))):
         raise HTTPException(status_code=404, detail="Level not found")
 
+    # A level holds a few dozen questions at most, so one LEFT JOIN beats the extra
+    # IN (...) round trip of selectinload (admin lists over all questions keep selectinload)
     result = await db.execute(
         select(Question)
         .where(Question.level_id == level_id)
-        .options(selectinload(Question.answers))
+        .order_by(Question.question_id)
+        .options(joinedload(Question.answers))
     )
-    questions = result.scalars().all()
-    return questions
+    questions = result.unique().scalars().all()
+    questions_out = _questions_adapter.validate_python(questions, from_attributes=True)
+    return Response(content=_questions_adapter.dump_json(questions_out), media_type="application/json")
 
 
 # -------------------------------------------------
@@ -150,29 +339,35 @@ async def update_user_progress_by_id(
     new_progress: int,
     db: AsyncSession = Depends(get_db),
 ):
-    user = await db.get(User, user_id)
+    result = await db.execute(
+        update(User)
+        .where(User.user_id == user_id)
+        .values(progress=new_progress)
+        .returning(User)
+    )
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    user.progress = new_progress
     await db.commit()
-    await db.refresh(user)
     return user
 
 
 @app.post("/user/register", response_model=UserOut)
 async def register_user(data: UserCreate, db: AsyncSession = Depends(get_db)):
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.login == data.login))
-    existing_user = result.scalar_one_or_none()
-    if existing_user:
+    # UNIQUE(login) does the duplicate check, no row comes back on conflict
+    hashed_password = await get_password_hash(data.password)
+    result = await db.execute(
+        upsert_insert(User)
+        .values(login=data.login, password=hashed_password, progress=0)
+        .on_conflict_do_nothing(index_elements=["login"])
+        .returning(User)
+    )
+    new_user = result.scalar_one_or_none()
+    if new_user is None:
         raise HTTPException(status_code=400, detail="User already exists")
 
-    hashed_password = get_password_hash(data.password)
-    new_user = User(login=data.login, password=hashed_password, progress=0)
-    db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
@@ -181,9 +376,14 @@ async def login_user(data: UserLoginIn, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.login == data.login))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(data.password, user.password):
+    verified = await verify_password(data.password, user.password if user else DUMMY_PASSWORD_HASH)
+    if not user or not verified:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    if password_needs_rehash(user.password):
+        user.password = await get_password_hash(data.password)
+        await db.commit()
+
     return user
 
 
@@ -197,12 +397,11 @@ async def change_password(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not verify_password(data.old_password, user.password):
+    if not await verify_password(data.old_password, user.password):
         raise HTTPException(status_code=400, detail="Invalid old password")
 
-    user.password = get_password_hash(data.new_password)
+    user.password = await get_password_hash(data.new_password)
     await db.commit()
-    await db.refresh(user)
     return user
 
 
@@ -216,18 +415,16 @@ async def change_login(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not verify_password(data.password, user.password):
+    if not await verify_password(data.password, user.password):
         raise HTTPException(status_code=400, detail="Invalid password")
 
-    # Check if new login is already taken
-    result = await db.execute(select(User).where(User.login == data.new_login))
-    existing = result.scalar_one_or_none()
-    if existing and existing.user_id != user_id:
-        raise HTTPException(status_code=400, detail="Login already taken")
-
+    # UNIQUE(login) rejects a login that is already taken
     user.login = data.new_login
-    await db.commit()
-    await db.refresh(user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Login already taken")
     return user
 
 
@@ -236,14 +433,17 @@ async def reset_password(data: UserResetPasswordIn, db: AsyncSession = Depends(g
     if data.code != RESET_CODE:
         raise HTTPException(status_code=400, detail="Invalid reset code")
 
-    result = await db.execute(select(User).where(User.login == data.login))
+    result = await db.execute(
+        update(User)
+        .where(User.login == data.login)
+        .values(password=await get_password_hash(data.new_password))
+        .returning(User)
+    )
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    user.password = get_password_hash(data.new_password)
     await db.commit()
-    await db.refresh(user)
     return user
 
 
@@ -259,17 +459,20 @@ async def admin_login(
     result = await db.execute(select(Admin).where(Admin.login == form_data.username))
     admin = result.scalar_one_or_none()
 
-    if not admin or not verify_password(form_data.password, admin.password):
+    verified = await verify_password(form_data.password, admin.password if admin else DUMMY_PASSWORD_HASH)
+    if not admin or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid admin credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    if password_needs_rehash(admin.password):
+        admin.password = await get_password_hash(form_data.password)
+        await db.commit()
+
     access_token = create_access_token(
         data={"sub": str(admin.id_admin), "role": "admin"},
-        expires_delta=access_token_expires,
     )
 
     return Token(access_token=access_token, token_type="bearer")
@@ -284,14 +487,19 @@ async def admin_get_levels(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
+    # Correlated count is answered from ix_questions_level_id, no join + GROUP BY
+    questions_count = (
+        select(func.count())
+        .select_from(Question)
+        .where(Question.level_id == Level.level_id)
+        .scalar_subquery()
+    )
     result = await db.execute(
         select(
             Level.level_id,
             Level.level_name,
-            func.count(Question.question_id).label("questions_count")
+            questions_count.label("questions_count")
         )
-        .outerjoin(Question, Level.level_id == Question.level_id)
-        .group_by(Level.level_id)
     )
     levels = result.all()
     return [
@@ -309,7 +517,7 @@ async def admin_create_level(
     new_level = Level(level_name=data.level_name)
     db.add(new_level)
     await db.commit()
-    await db.refresh(new_level)
+    invalidate_levels_cache()
     return new_level
 
 
@@ -320,13 +528,18 @@ async def admin_update_level(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    level = await db.get(Level, level_id)
+    result = await db.execute(
+        update(Level)
+        .where(Level.level_id == level_id)
+        .values(level_name=data.level_name)
+        .returning(Level)
+    )
+    level = result.scalar_one_or_none()
     if not level:
         raise HTTPException(status_code=404, detail="Level not found")
 
-    level.level_name = data.level_name
     await db.commit()
-    await db.refresh(level)
+    invalidate_levels_cache()
     return level
 
 
@@ -336,12 +549,20 @@ async def admin_delete_level(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    level = await db.get(Level, level_id)
-    if not level:
+    # Same cascade as the ORM relationship, but as three set-based DELETEs
+    # instead of loading every question and answer of the level first
+    question_ids = select(Question.question_id).where(Question.level_id == level_id)
+    await db.execute(delete(Answer).where(Answer.question_id.in_(question_ids)))
+    await db.execute(delete(Question).where(Question.level_id == level_id))
+    result = await db.execute(
+        delete(Level).where(Level.level_id == level_id).returning(Level.level_id)
+    )
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Level not found")
 
-    await db.delete(level)
     await db.commit()
+    invalidate_levels_cache()
     return {"detail": "Level deleted"}
 
 
@@ -351,14 +572,16 @@ async def admin_delete_level(
 
 @app.get("/admin/questions", response_model=list[QuestionOut])
 async def admin_get_questions(
+    after_id: int = 0,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Question).options(selectinload(Question.answers))
+    return stream_json_list(
+        paginate(select(Question), Question.question_id, after_id, limit)
+        .options(selectinload(Question.answers)),
+        lambda question: QuestionOut.model_validate(question).model_dump_json().encode(),
+        scalars=True,
     )
-    questions = result.scalars().all()
-    return questions
 
 
 @app.post("/admin/questions", response_model=QuestionOut)
@@ -367,23 +590,15 @@ async def admin_create_question(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    # Check if level exists
-    level = await db.get(Level, data.level_id)
-    if not level:
-        raise HTTPException(status_code=404, detail="Level not found")
-
-    new_question = Question(question=data.question, level_id=data.level_id)
+    # The level_id foreign key rejects unknown levels
+    new_question = Question(question=data.question, level_id=data.level_id, answers=[])
     db.add(new_question)
-    await db.commit()
-    await db.refresh(new_question)
-
-    # Load answers relationship for response
-    result = await db.execute(
-        select(Question)
-        .where(Question.question_id == new_question.question_id)
-        .options(selectinload(Question.answers))
-    )
-    return result.scalar_one()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Level not found")
+    return new_question
 
 
 @app.put("/admin/questions/{question_id}", response_model=QuestionOut)
@@ -393,20 +608,19 @@ async def admin_update_question(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    question = await db.get(Question, question_id)
-    if not question:
-        raise HTTPException(status_code=404, detail="Question not found")
-
-    question.question = data.question
-    await db.commit()
-
-    # Load with answers
     result = await db.execute(
-        select(Question)
+        update(Question)
         .where(Question.question_id == question_id)
+        .values(question=data.question)
+        .returning(Question)
         .options(selectinload(Question.answers))
     )
-    return result.scalar_one()
+    question = result.scalar_one_or_none()
+    if not question:
+        raise HTTPException(status_code=404, detail="Question not found")
+
+    await db.commit()
+    return question
 
 
 @app.delete("/admin/questions/{question_id}")
@@ -415,11 +629,14 @@ async def admin_delete_question(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    question = await db.get(Question, question_id)
-    if not question:
+    await db.execute(delete(Answer).where(Answer.question_id == question_id))
+    result = await db.execute(
+        delete(Question).where(Question.question_id == question_id).returning(Question.question_id)
+    )
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Question not found")
 
-    await db.delete(question)
     await db.commit()
     return {"detail": "Question deleted"}
 
@@ -430,12 +647,15 @@ async def admin_delete_question(
 
 @app.get("/admin/answers", response_model=list[AnswerOut])
 async def admin_get_answers(
+    after_id: int = 0,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Answer))
-    answers = result.scalars().all()
-    return answers
+    # Plain column rows go straight to orjson, no ORM objects or model validation
+    return stream_json_list(
+        paginate(select(Answer.answer_id, Answer.answer, Answer.is_good), Answer.answer_id, after_id, limit),
+        lambda row: orjson.dumps(dict(row)),
+    )
 
 
 @app.post("/admin/answers", response_model=AnswerOut)
@@ -444,19 +664,18 @@ async def admin_create_answer(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    # Check if question exists
-    question = await db.get(Question, data.question_id)
-    if not question:
-        raise HTTPException(status_code=404, detail="Question not found")
-
+    # The question_id foreign key rejects unknown questions
     new_answer = Answer(
         answer=data.answer,
         is_good=data.is_good,
         question_id=data.question_id
     )
     db.add(new_answer)
-    await db.commit()
-    await db.refresh(new_answer)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Question not found")
     return new_answer
 
 
@@ -467,14 +686,17 @@ async def admin_update_answer(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    answer = await db.get(Answer, answer_id)
+    result = await db.execute(
+        update(Answer)
+        .where(Answer.answer_id == answer_id)
+        .values(answer=data.answer, is_good=data.is_good)
+        .returning(Answer)
+    )
+    answer = result.scalar_one_or_none()
     if not answer:
         raise HTTPException(status_code=404, detail="Answer not found")
 
-    answer.answer = data.answer
-    answer.is_good = data.is_good
     await db.commit()
-    await db.refresh(answer)
     return answer
 
 
@@ -484,11 +706,12 @@ async def admin_delete_answer(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    answer = await db.get(Answer, answer_id)
-    if not answer:
+    result = await db.execute(
+        delete(Answer).where(Answer.answer_id == answer_id).returning(Answer.answer_id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Answer not found")
 
-    await db.delete(answer)
     await db.commit()
     return {"detail": "Answer deleted"}
 
@@ -499,12 +722,15 @@ async def admin_delete_answer(
 
 @app.get("/admin/users", response_model=list[UserOut])
 async def admin_get_users(
+    after_id: int = 0,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+    # Only the UserOut columns are selected, password hashes are never read
+    return stream_json_list(
+        paginate(select(User.user_id, User.login, User.progress), User.user_id, after_id, limit),
+        lambda row: orjson.dumps(dict(row)),
+    )
 
 
 @app.put("/admin/users/{user_id}/reset-progress", response_model=UserOut)
@@ -513,13 +739,17 @@ async def admin_reset_progress(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    user = await db.get(User, user_id)
+    result = await db.execute(
+        update(User)
+        .where(User.user_id == user_id)
+        .values(progress=0)
+        .returning(User)
+    )
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    user.progress = 0
     await db.commit()
-    await db.refresh(user)
     return user
 
 
@@ -529,10 +759,11 @@ async def admin_delete_user(
     current_admin: dict = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    user = await db.get(User, user_id)
-    if not user:
+    result = await db.execute(
+        delete(User).where(User.user_id == user_id).returning(User.user_id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    await db.delete(user)
     await db.commit()
     return {"detail": "User deleted"}
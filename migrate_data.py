@@ -1,17 +1,26 @@
 # migrate_data.py - Migrate data from fiszki.db to database.sqlite
 
 import asyncio
+import os
 import sqlite3
-import bcrypt
-from sqlalchemy import select
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import insert
 
 from database import engine, AsyncSessionLocal
 from models import Base, Admin, Level, Question, Answer, User
+from passwords import hash_password
 
 
-def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash many passwords in parallel, one Argon2id hash per CPU core at a time."""
+    if not passwords:
+        return []
+    workers = os.cpu_count() or 1
+    # A few chunks per worker: fewer IPC round trips, but still balanced across cores
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(hash_password, passwords, chunksize=chunksize))
 
 
 async def migrate_data():
@@ -26,78 +35,78 @@ async def migrate_data():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Hash the plain text passwords of admins and users in one parallel pass
+    print("Hashing passwords...")
+    admin_rows = source_cursor.execute("SELECT * FROM administrators").fetchall()
+    user_rows = source_cursor.execute("SELECT * FROM logins").fetchall()
+    hashes = hash_passwords([row["password"] for row in admin_rows + user_rows])
+    admin_passwords, user_passwords = hashes[:len(admin_rows)], hashes[len(admin_rows):]
+
+    # Each table is written with one executemany INSERT instead of an ORM object per row
     async with AsyncSessionLocal() as session:
         # 1. Migrate administrators -> admins
         print("Migrating administrators...")
-        source_cursor.execute("SELECT * FROM administrators")
-        for row in source_cursor.fetchall():
-            admin = Admin(
-                id_admin=row["id_admin"],
-                login=row["login"],
-                password=hash_password(row["password"])  # Hash the plain text password
-            )
-            session.add(admin)
-        await session.flush()
+        if admin_rows:
+            await session.execute(insert(Admin), [
+                {"id_admin": row["id_admin"], "login": row["login"], "password": password}
+                for row, password in zip(admin_rows, admin_passwords)
+            ])
         print(f"  - Migrated administrators")
 
         # 2. Migrate levels
         print("Migrating levels...")
-        source_cursor.execute("SELECT * FROM levels")
-        for row in source_cursor.fetchall():
-            level = Level(
-                level_id=row["level_id"],
-                level_name=row["level_name"]
-            )
-            session.add(level)
-        await session.flush()
+        rows = source_cursor.execute("SELECT * FROM levels").fetchall()
+        if rows:
+            await session.execute(insert(Level), [
+                {"level_id": row["level_id"], "level_name": row["level_name"]}
+                for row in rows
+            ])
         print(f"  - Migrated levels")
 
         # 3. Migrate questions
         print("Migrating questions...")
-        source_cursor.execute("SELECT * FROM questions")
-        for row in source_cursor.fetchall():
-            question = Question(
-                question_id=row["question_id"],
-                level_id=row["level_id"],
-                question=row["question"]
-            )
-            session.add(question)
-        await session.flush()
+        rows = source_cursor.execute("SELECT * FROM questions").fetchall()
+        if rows:
+            await session.execute(insert(Question), [
+                {"question_id": row["question_id"], "level_id": row["level_id"], "question": row["question"]}
+                for row in rows
+            ])
         print(f"  - Migrated questions")
 
         # 4. Migrate answers
         print("Migrating answers...")
-        source_cursor.execute("SELECT * FROM answers")
-        for row in source_cursor.fetchall():
-            answer = Answer(
-                answer_id=row["answer_id"],
-                question_id=row["question_id"],
-                answer=row["answer"],
-                is_good=row["is_good"]
-            )
-            session.add(answer)
-        await session.flush()
+        rows = source_cursor.execute("SELECT * FROM answers").fetchall()
+        if rows:
+            await session.execute(insert(Answer), [
+                {
+                    "answer_id": row["answer_id"],
+                    "question_id": row["question_id"],
+                    "answer": row["answer"],
+                    "is_good": row["is_good"],
+                }
+                for row in rows
+            ])
         print(f"  - Migrated answers")
 
         # 5. Migrate logins -> users
         print("Migrating users...")
-        source_cursor.execute("SELECT * FROM logins")
-        for row in source_cursor.fetchall():
-            user = User(
-                user_id=row["user_id"],
-                login=row["login"],
-                password=hash_password(row["password"]),  # Hash the plain text password
-                progress=row["progress"]
-            )
-            session.add(user)
-        await session.flush()
+        if user_rows:
+            await session.execute(insert(User), [
+                {
+                    "user_id": row["user_id"],
+                    "login": row["login"],
+                    "password": password,
+                    "progress": row["progress"],
+                }
+                for row, password in zip(user_rows, user_passwords)
+            ])
         print(f"  - Migrated users")
 
         await session.commit()
 
     source_conn.close()
     print("\nMigration complete!")
-    print("Note: All passwords have been hashed with bcrypt.")
+    print("Note: All passwords have been hashed with Argon2id.")
 
 
 if __name__ == "__main__":
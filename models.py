@@ -28,10 +28,12 @@ class Question(Base):
 
     question_id = Column(Integer, primary_key=True, index=True)
     question = Column(String, nullable=False)
-    level_id = Column(Integer, ForeignKey("levels.level_id"), nullable=False)
+    level_id = Column(Integer, ForeignKey("levels.level_id"), nullable=False, index=True)
 
     level = relationship("Level", back_populates="questions")
-    answers = relationship("Answer", back_populates="question", cascade="all, delete-orphan")
+    answers = relationship(
+        "Answer", back_populates="question", cascade="all, delete-orphan", order_by="Answer.answer_id"
+    )
 
 
 class Answer(Base):
@@ -40,7 +42,7 @@ class Answer(Base):
     answer_id = Column(Integer, primary_key=True, index=True)
     answer = Column(String, nullable=False)
     is_good = Column(Integer, default=0)  # 0 or 1
-    question_id = Column(Integer, ForeignKey("questions.question_id"), nullable=False)
+    question_id = Column(Integer, ForeignKey("questions.question_id"), nullable=False, index=True)
 
     question = relationship("Question", back_populates="answers")
 
@@ -0,0 +1,12 @@
+# passwords.py - Password hashing shared by the app, migrate_data.py and seeders/
+
+from argon2 import PasswordHasher
+
+# Every stored password is hashed with these Argon2id parameters, so a login
+# costs the same whichever account it is for (see DUMMY_PASSWORD_HASH in main.py)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=4)
+
+
+def hash_password(password: str) -> str:
+    """Hash password using Argon2id."""
+    return password_hasher.hash(password)
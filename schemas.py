@@ -95,15 +95,6 @@ class UserUpdate(BaseModel):
     login: str | None = None
     password: str | None = None
 
-class UserOut(BaseModel):
-    user_id: int
-    login: str
-    password: str
-    progress: int
-
-    class Config:
-        from_attributes = True
-
 
 class UserLoginIn(BaseModel):
     login: str
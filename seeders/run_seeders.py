@@ -1,119 +1,180 @@
 # seeders/run_seeders.py - Run all seeders to populate database
+# Usage (from the project root): python -m seeders.run_seeders [--fresh]
 
 import asyncio
+import json
 import sys
+from itertools import islice
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from sqlalchemy import select, text
-
-from database import engine, AsyncSessionLocal
+from database import engine, IS_SQLITE
 from models import Base, Admin, Level, Question, Answer, User
+from passwords import hash_password, password_hasher
 from seeders.seed_data import (
-    hash_password,
     ADMINS_DATA,
-    LEVELS_DATA,
-    QUESTIONS_DATA,
-    ANSWERS_DATA,
+    iter_csv_table,
     USERS_DATA,
 )
 
 
+# Seed passwords never change, so their hashes are kept between runs and only
+# cache misses are hashed. The salt lives inside each hash, so reusing them is safe;
+# entries made with other hashing parameters (or bcrypt) count as misses.
+HASH_CACHE_PATH = Path(__file__).parent / ".hash_cache.json"
+
+
+def load_hash_cache() -> dict[str, str]:
+    try:
+        return json.loads(HASH_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_hash_cache(cache: dict[str, str]):
+    try:
+        HASH_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass  # Read-only checkout: just hash again next time
+
+
+def is_current_hash(hashed: str) -> bool:
+    """True for a hash made with the current passwords.password_hasher parameters."""
+    return hashed.startswith("$argon2") and not password_hasher.check_needs_rehash(hashed)
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash passwords concurrently on worker threads, reusing cached hashes.
+
+    argon2-cffi releases the GIL while hashing, so threads run in parallel without
+    the start-up cost of a process pool.
+    """
+    cache = load_hash_cache()
+    misses = list(dict.fromkeys(
+        password for password in passwords if not is_current_hash(cache.get(password, ""))
+    ))
+
+    if misses:
+        hashes = await asyncio.gather(*(
+            asyncio.to_thread(hash_password, password) for password in misses
+        ))
+        cache.update(zip(misses, hashes))
+        save_hash_cache(cache)
+
+    return [cache[password] for password in passwords]
+
+
+def create_missing_tables(sync_conn):
+    """Create tables that don't exist yet.
+
+    One table listing replaces create_all's per-table existence probe.
+    """
+    existing = set(inspect(sync_conn).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+
+
+# Delete in reverse order of dependencies with foreign key checks disabled.
+# PRAGMA foreign_keys is a no-op inside a transaction, hence the explicit BEGIN/COMMIT.
+CLEAR_SCRIPT = """
+PRAGMA foreign_keys = OFF;
+BEGIN;
+DELETE FROM answers;
+DELETE FROM questions;
+DELETE FROM levels;
+DELETE FROM users;
+DELETE FROM admins;
+COMMIT;
+PRAGMA foreign_keys = ON;
+"""
+
+
 async def clear_database():
     """Clear all data from database (preserves tables)."""
-    async with AsyncSessionLocal() as session:
-        # Disable foreign key checks temporarily
-        await session.execute(text("PRAGMA foreign_keys = OFF"))
-
-        # Delete in reverse order of dependencies
-        await session.execute(text("DELETE FROM answers"))
-        await session.execute(text("DELETE FROM questions"))
-        await session.execute(text("DELETE FROM levels"))
-        await session.execute(text("DELETE FROM users"))
-        await session.execute(text("DELETE FROM admins"))
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(CLEAR_SCRIPT)
 
         # Reset autoincrement counters (if sqlite_sequence exists)
         try:
-            await session.execute(text("DELETE FROM sqlite_sequence"))
+            await raw.driver_connection.executescript("DELETE FROM sqlite_sequence;")
         except Exception:
             pass  # Table may not exist if AUTOINCREMENT was never used
+    print("Database cleared.")
 
-        # Re-enable foreign key checks
-        await session.execute(text("PRAGMA foreign_keys = ON"))
 
-        await session.commit()
-    print("Database cleared.")
+upsert_insert = sqlite_insert if IS_SQLITE else postgresql_insert
+
 
+def seed_insert(table):
+    """INSERT that skips rows which already exist, returning the inserted keys."""
+    return upsert_insert(table).on_conflict_do_nothing().returning(*table.primary_key)
 
-async def seed_admins():
+
+# Built once at import so SQLAlchemy's compiled cache is reused on every call
+INSERT_ADMINS = seed_insert(Admin.__table__)
+INSERT_LEVELS = seed_insert(Level.__table__)
+INSERT_QUESTIONS = seed_insert(Question.__table__)
+INSERT_ANSWERS = seed_insert(Answer.__table__)
+INSERT_USERS = seed_insert(User.__table__)
+
+# Rows are streamed into executemany this many at a time, so a large seed set
+# never has to be held in memory at once
+SEED_BATCH_SIZE = 500
+
+
+async def insert_batches(conn: AsyncConnection, stmt, rows) -> int:
+    """Insert parameter dicts from any iterable in batches; return the number inserted."""
+    rows = iter(rows)
+    inserted = 0
+    while batch := list(islice(rows, SEED_BATCH_SIZE)):
+        inserted += len((await conn.execute(stmt, batch)).all())
+    return inserted
+
+
+async def seed_admins(conn: AsyncConnection):
     """Seed administrators."""
-    async with AsyncSessionLocal() as session:
-        for admin_data in ADMINS_DATA:
-            admin = Admin(
-                login=admin_data["login"],
-                password=hash_password(admin_data["password"])
-            )
-            session.add(admin)
-        await session.commit()
-    print(f"Seeded {len(ADMINS_DATA)} admin(s)")
-
-
-async def seed_levels():
+    inserted = await insert_batches(conn, INSERT_ADMINS, (
+        {"login": admin.login, "password": admin.password_hash} for admin in ADMINS_DATA
+    ))
+    print(f"Seeded {inserted} admin(s)")
+
+
+async def seed_levels(conn: AsyncConnection):
     """Seed levels."""
-    async with AsyncSessionLocal() as session:
-        for level_data in LEVELS_DATA:
-            level = Level(
-                level_id=level_data["level_id"],
-                level_name=level_data["level_name"]
-            )
-            session.add(level)
-        await session.commit()
-    print(f"Seeded {len(LEVELS_DATA)} level(s)")
-
-
-async def seed_questions():
+    inserted = await insert_batches(conn, INSERT_LEVELS, (
+        level._asdict() for level in iter_csv_table("levels")
+    ))
+    print(f"Seeded {inserted} level(s)")
+
+
+async def seed_questions(conn: AsyncConnection):
     """Seed questions."""
-    async with AsyncSessionLocal() as session:
-        for q_data in QUESTIONS_DATA:
-            question = Question(
-                question_id=q_data["question_id"],
-                level_id=q_data["level_id"],
-                question=q_data["question"]
-            )
-            session.add(question)
-        await session.commit()
-    print(f"Seeded {len(QUESTIONS_DATA)} question(s)")
-
-
-async def seed_answers():
+    inserted = await insert_batches(conn, INSERT_QUESTIONS, (
+        question._asdict() for question in iter_csv_table("questions")
+    ))
+    print(f"Seeded {inserted} question(s)")
+
+
+async def seed_answers(conn: AsyncConnection):
     """Seed answers."""
-    async with AsyncSessionLocal() as session:
-        for a_data in ANSWERS_DATA:
-            answer = Answer(
-                answer_id=a_data["answer_id"],
-                question_id=a_data["question_id"],
-                answer=a_data["answer"],
-                is_good=a_data["is_good"]
-            )
-            session.add(answer)
-        await session.commit()
-    print(f"Seeded {len(ANSWERS_DATA)} answer(s)")
-
-
-async def seed_users():
+    inserted = await insert_batches(conn, INSERT_ANSWERS, (
+        answer._asdict() for answer in iter_csv_table("answers")
+    ))
+    print(f"Seeded {inserted} answer(s)")
+
+
+async def seed_users(conn: AsyncConnection, hashes: list[str]):
     """Seed test users."""
-    async with AsyncSessionLocal() as session:
-        for user_data in USERS_DATA:
-            user = User(
-                login=user_data["login"],
-                password=hash_password(user_data["password"]),
-                progress=user_data["progress"]
-            )
-            session.add(user)
-        await session.commit()
-    print(f"Seeded {len(USERS_DATA)} user(s)")
+    inserted = await insert_batches(conn, INSERT_USERS, (
+        user._replace(password=password)._asdict() for user, password in zip(USERS_DATA, hashes)
+    ))
+    print(f"Seeded {inserted} user(s)")
 
 
 async def run_all_seeders(fresh: bool = False):
@@ -126,33 +187,66 @@ async def run_all_seeders(fresh: bool = False):
     print("Running database seeders")
     print("=" * 50)
 
-    # Create tables if they don't exist
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    if fresh:
-        await clear_database()
-
-    # Check if data already exists
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(select(Admin))
-        if result.scalar_one_or_none() and not fresh:
-            print("\nDatabase already has data. Use --fresh to clear and reseed.")
-            print("Exiting without changes.")
-            return
-
-    # Run seeders in order
-    await seed_admins()
-    await seed_levels()
-    await seed_questions()
-    await seed_answers()
-    await seed_users()
+    # Hash on worker threads while the schema is prepared, and finish before
+    # the seed transaction opens so the write lock isn't held meanwhile
+    hashing = asyncio.create_task(hash_passwords(
+        [user.password for user in USERS_DATA]
+    ))
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(create_missing_tables)
+
+        if fresh:
+            await clear_database()
+    except BaseException:
+        hashing.cancel()
+        raise
+
+    user_hashes = await hashing
+
+    # Run seeders in order, all in one transaction. Rows that already exist are
+    # skipped, so re-running without --fresh only fills in what is missing.
+    async with engine.connect() as conn:
+        if IS_SQLITE:
+            # The seed is safe to re-run, so skip the fsync on its commit. The
+            # connection goes back to the pool afterwards, hence the restore.
+            synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+            await conn.exec_driver_sql("PRAGMA synchronous = OFF")
+            await conn.commit()
+        try:
+            async with conn.begin():
+                await seed_admins(conn)
+                await seed_levels(conn)
+                await seed_questions(conn)
+                await seed_answers(conn)
+                await seed_users(conn, user_hashes)
+        finally:
+            if IS_SQLITE:
+                await conn.exec_driver_sql(f"PRAGMA synchronous = {synchronous}")
+                await conn.commit()
 
     print("=" * 50)
     print("Seeding complete!")
     print("=" * 50)
 
 
+def main(argv: list[str] | None = None, runner: asyncio.Runner | None = None):
+    """Run the seeders with command-line style flags (--fresh).
+
+    argv defaults to no flags; only the __main__ block passes sys.argv.
+    Callers that seed repeatedly (e.g. test fixtures) can pass a shared
+    asyncio.Runner so the event loop, and the pooled connections bound to it,
+    are reused instead of being rebuilt on every call.
+    """
+    argv = argv or []
+    fresh = "--fresh" in argv
+    if runner is not None:
+        runner.run(run_all_seeders(fresh=fresh))
+        return
+    with asyncio.Runner() as runner:
+        runner.run(run_all_seeders(fresh=fresh))
+
+
 if __name__ == "__main__":
-    fresh = "--fresh" in sys.argv
-    asyncio.run(run_all_seeders(fresh=fresh))
+    main(sys.argv[1:])